@@ -5,6 +5,7 @@ from gpt4all import GPT4All
 import re
 import json
 from datetime import datetime
+from prompt_compaction import MAX_STRIPPED_SHARE, MOSTLY_STRIPPED_SHARE, compact_description, count_tokens, learn_boilerplate_shingles
 
 # GPU configuration
 os.environ["CUDA_VISIBLE_DEVICES"] = "0"  # Use first GPU
@@ -240,6 +241,13 @@ def process_jobs():
             cur.execute("SELECT * FROM cleaned_jobs;")
             jobs = cur.fetchall()
 
+            boilerplate = learn_boilerplate_shingles(jobs)
+            raw_tokens = 0
+            prompt_tokens = 0
+            mostly_stripped_jobs = 0
+            fallback_jobs = 0
+            empty_prompt_jobs = 0
+
             for job in jobs:
                 job_id = job["job_id"]
                 if job_exists_in_postgres(job_id):
@@ -247,10 +255,38 @@ def process_jobs():
                     continue
 
                 print(f"Processing job with ID: {job_id}")
-                extracted_skills = extract_skills_from_response(job["description"] or "")
+                description = job["description"] or ""
+                prompt_text, stripped_share = compact_description(description, job["company_id"], boilerplate)
+                description_tokens = count_tokens(description)
+                prompt_text_tokens = count_tokens(prompt_text)
+                raw_tokens += description_tokens
+                prompt_tokens += prompt_text_tokens
+                if stripped_share >= MOSTLY_STRIPPED_SHARE:
+                    mostly_stripped_jobs += 1
+                if stripped_share > MAX_STRIPPED_SHARE:
+                    fallback_jobs += 1
+                if not prompt_text:
+                    empty_prompt_jobs += 1
+                print(
+                    f"Prompt tokens: {description_tokens} -> {prompt_text_tokens} "
+                    f"({stripped_share:.0%} stripped as boilerplate)"
+                )
+
+                extracted_skills = extract_skills_from_response(prompt_text)
                 print("Extracted skills:", extracted_skills)
                 insert_job_data(job, extracted_skills)
 
+            saved_tokens = raw_tokens - prompt_tokens
+            saved_share = saved_tokens / raw_tokens * 100 if raw_tokens else 0.0
+            print(
+                f"Prompt compaction: {raw_tokens} raw tokens -> {prompt_tokens} prompt tokens, "
+                f"saved {saved_tokens} ({saved_share:.1f}%)"
+            )
+            print(
+                f"Boilerplate stripping: {mostly_stripped_jobs} jobs lost most of their description, "
+                f"{fallback_jobs} fell back to the full description, {empty_prompt_jobs} had an empty prompt"
+            )
+
 
 # Run the processing function
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 from wordcloud import WordCloud
@@ -8,6 +9,7 @@ import requests
 import re
 from rapidfuzz import process, fuzz
 from bs4 import BeautifulSoup
+from insights_cube import CUBE_DIMENSIONS, build_insights_cube, consolidate_skills, query_insights_cube
 
 # Set Seaborn style for better visuals
 sns.set_style("whitegrid")
@@ -23,20 +25,6 @@ def fetch_data_from_github(url):
     response.raise_for_status()
     return pd.read_csv(io.StringIO(response.text))
 
-# Fuzzy Matching for Skill Consolidation
-def consolidate_skills(skills_list, threshold=80):
-    consolidated = {}
-    for skill in skills_list:
-        matched = False
-        for key in list(consolidated.keys()):
-            if fuzz.token_set_ratio(skill.lower(), key.lower()) >= threshold:
-                consolidated[key] += 1
-                matched = True
-                break
-        if not matched:
-            consolidated[skill] = 1
-    return consolidated
-
 # Clean and Extract Skills
 def clean_and_extract_skills(input_text):
     if not isinstance(input_text, str):
@@ -85,6 +73,11 @@ def load_data():
         st.error(f"Error loading data: {e}")
         return pd.DataFrame(), pd.DataFrame()
 
+# Pre-aggregated Insights cube, cached across widget changes
+@st.cache_data
+def load_insights_cube(_jobs_data):
+    return build_insights_cube(_jobs_data)
+
 def generate_wordcloud(data, column, title):
     text = ' '.join([word for words in data[column].dropna() for word in words])
     wordcloud = WordCloud(background_color='white', colormap='viridis', width=1000, height=500).generate(text)
@@ -132,18 +125,30 @@ elif page == "Courses Data":
 elif page == "Insights & Visualizations":
     st.header("Insights & Visualizations")
 
+    # Cross-filters answered from the pre-aggregated cube
+    cube = load_insights_cube(cleaned_jobs)
+    filter_titles = ["Location", "Experience Level", "Work Type", "Remote Allowed"]
+    filters = {
+        column: st.sidebar.multiselect(f"{title}:", list(cube['labels'][dim]))
+        for dim, (column, title) in enumerate(zip(CUBE_DIMENSIONS, filter_titles))
+    }
+    insights = query_insights_cube(cube, filters)
+
     # Job Skills Distribution
     st.subheader("Distribution of Job Skills")
-    job_skills = consolidate_skills(cleaned_jobs['extracted_skills'].explode().dropna().tolist())
+    job_skills = insights['skills']
     sorted_job_skills = sorted(job_skills.items(), key=lambda x: x[1], reverse=True)[:10]
-    skill_names, skill_counts = zip(*sorted_job_skills)
 
-    plt.figure(figsize=(12, 6))
-    sns.barplot(x=skill_counts, y=skill_names, palette='viridis')
-    plt.title("Top 10 Skills in Job Postings", fontsize=20)
-    plt.xlabel("Count", fontsize=16)
-    plt.ylabel("Skill", fontsize=16)
-    st.pyplot(plt)
+    if sorted_job_skills:
+        skill_names, skill_counts = zip(*sorted_job_skills)
+        plt.figure(figsize=(12, 6))
+        sns.barplot(x=list(skill_counts), y=list(skill_names), palette='viridis')
+        plt.title("Top 10 Skills in Job Postings", fontsize=20)
+        plt.xlabel("Count", fontsize=16)
+        plt.ylabel("Skill", fontsize=16)
+        st.pyplot(plt)
+    else:
+        st.write("No job postings match the selected filters.")
 
     # Skill Comparison between Jobs and Courses
     st.subheader("Skill Comparison: Jobs vs Courses")
@@ -173,17 +178,19 @@ elif page == "Insights & Visualizations":
 
     # Salary Distribution
     st.subheader("Salary Distribution")
-    if 'med_salary' in cleaned_jobs.columns:
+    if len(cube['salary_edges']):
+        salary_edges = cube['salary_edges']
         plt.figure(figsize=(12, 6))
-        sns.histplot(cleaned_jobs['med_salary'].dropna(), bins=20, kde=True, color='blue')
+        plt.bar(salary_edges[:-1], insights['salary_counts'], width=np.diff(salary_edges), align='edge', color='blue', alpha=0.6)
         plt.title("Distribution of Median Salaries", fontsize=20)
         st.pyplot(plt)
 
     # Work Type Distribution
     st.subheader("Distribution of Work Types")
-    if 'work_type' in cleaned_jobs.columns:
+    work_type_counts = {work_type: count for work_type, count in insights['work_type_counts'].items() if count > 0}
+    if 'work_type' in cleaned_jobs.columns and work_type_counts:
         plt.figure(figsize=(12, 6))
-        sns.countplot(y=cleaned_jobs['work_type'], palette='coolwarm')
+        sns.barplot(x=list(work_type_counts.values()), y=list(work_type_counts.keys()), palette='coolwarm')
         plt.title("Distribution of Work Types", fontsize=20)
         st.pyplot(plt)
 
@@ -0,0 +1,118 @@
+import numpy as np
+import pandas as pd
+from rapidfuzz import fuzz
+
+# Fuzzy Matching for Skill Consolidation
+def consolidate_skills(skills_list, threshold=80):
+    consolidated = {}
+    for skill in skills_list:
+        matched = False
+        for key in list(consolidated.keys()):
+            if fuzz.token_set_ratio(skill.lower(), key.lower()) >= threshold:
+                consolidated[key] += 1
+                matched = True
+                break
+        if not matched:
+            consolidated[skill] = 1
+    return consolidated
+
+# Map each skill to its consolidated name (same grouping as consolidate_skills)
+def build_skill_index(skills_list, threshold=80):
+    skill_index = {}
+    keys = []
+    for skill in skills_list:
+        if skill in skill_index:
+            continue
+        for key in keys:
+            if fuzz.token_set_ratio(skill.lower(), key.lower()) >= threshold:
+                skill_index[skill] = key
+                break
+        else:
+            keys.append(skill)
+            skill_index[skill] = skill
+    return skill_index
+
+# Insights cube dimensions and salary histogram bins
+CUBE_DIMENSIONS = ['location', 'formatted_experience_level', 'work_type', 'remote_allowed']
+WORK_TYPE_DIM = CUBE_DIMENSIONS.index('work_type')
+SALARY_BINS = 20
+
+def dimension_labels(jobs_data, column):
+    if column not in jobs_data.columns:
+        return pd.Series("Unknown", index=jobs_data.index)
+    values = jobs_data[column]
+    if column == 'remote_allowed':
+        values = values.map({1: "Yes", 0: "No", True: "Yes", False: "No"})
+    return values.fillna("Unknown").astype(str)
+
+# Pre-aggregate jobs into cells of the dimension combinations that occur
+def build_insights_cube(jobs_data):
+    jobs_data = jobs_data.reset_index(drop=True)
+
+    codes, labels = [], []
+    for column in CUBE_DIMENSIONS:
+        dim_codes, dim_labels = pd.factorize(dimension_labels(jobs_data, column), sort=True)
+        codes.append(dim_codes)
+        labels.append(np.asarray(dim_labels, dtype=object))
+    shape = tuple(max(len(dim_labels), 1) for dim_labels in labels)
+    cell_ids, job_cells = np.unique(np.ravel_multi_index(codes, shape), return_inverse=True)
+    cell_keys = np.column_stack(np.unravel_index(cell_ids, shape)).astype(np.int32)
+    n_cells = len(cell_ids)
+
+    # Job counts per cell (work type is a dimension, so this also gives work type counts)
+    job_counts = np.bincount(job_cells, minlength=n_cells).astype(np.int32)
+
+    # Salary histogram per cell
+    salaries = jobs_data['med_salary'].to_numpy(dtype=float) if 'med_salary' in jobs_data.columns else np.array([])
+    valid = ~np.isnan(salaries)
+    salary_edges = np.histogram_bin_edges(salaries[valid], bins=SALARY_BINS) if valid.any() else np.array([])
+    salary_counts = np.zeros((n_cells, max(len(salary_edges) - 1, 0)), dtype=np.int32)
+    if valid.any():
+        salary_bins = np.clip(np.searchsorted(salary_edges, salaries[valid], side='right') - 1, 0, SALARY_BINS - 1)
+        np.add.at(salary_counts, (job_cells[valid], salary_bins), 1)
+
+    # Consolidated skill counts per cell, stored sparsely as (cell, skill, count)
+    exploded = jobs_data['extracted_skills'].explode().dropna()
+    skill_index = build_skill_index(exploded.tolist())
+    skill_codes, skill_names = pd.factorize(exploded.map(skill_index))
+    pair_ids, pair_counts = np.unique(
+        job_cells[exploded.index.to_numpy()].astype(np.int64) * max(len(skill_names), 1) + skill_codes,
+        return_counts=True
+    )
+    skill_cells, skill_ids = np.divmod(pair_ids, max(len(skill_names), 1))
+
+    return {
+        'labels': labels,
+        'cell_keys': cell_keys,
+        'job_counts': job_counts,
+        'salary_edges': salary_edges,
+        'salary_counts': salary_counts,
+        'skill_names': np.asarray(skill_names, dtype=object),
+        'skill_cells': skill_cells.astype(np.int32),
+        'skill_ids': skill_ids.astype(np.int32),
+        'skill_counts': pair_counts.astype(np.int32),
+    }
+
+# Answer a filter combination by masking cube cells and summing them
+def query_insights_cube(cube, filters):
+    cell_mask = np.ones(len(cube['cell_keys']), dtype=bool)
+    for dim, column in enumerate(CUBE_DIMENSIONS):
+        selected = filters.get(column)
+        if selected:
+            selected_codes = np.flatnonzero(np.isin(cube['labels'][dim], selected))
+            cell_mask &= np.isin(cube['cell_keys'][:, dim], selected_codes)
+
+    skill_mask = cell_mask[cube['skill_cells']]
+    skill_counts = np.bincount(
+        cube['skill_ids'][skill_mask], weights=cube['skill_counts'][skill_mask],
+        minlength=len(cube['skill_names'])
+    ).astype(np.int64)
+    work_type_counts = np.bincount(
+        cube['cell_keys'][cell_mask, WORK_TYPE_DIM], weights=cube['job_counts'][cell_mask],
+        minlength=len(cube['labels'][WORK_TYPE_DIM])
+    ).astype(np.int64)
+    return {
+        'skills': dict(zip(cube['skill_names'][skill_counts > 0], skill_counts[skill_counts > 0])),
+        'salary_counts': cube['salary_counts'][cell_mask].sum(axis=0),
+        'work_type_counts': dict(zip(cube['labels'][WORK_TYPE_DIM], work_type_counts)),
+    }
@@ -0,0 +1,157 @@
+import re
+import zlib
+from collections import Counter, defaultdict
+from bs4 import BeautifulSoup
+
+# Prompt compaction settings
+SHINGLE_SIZE = 5  # Words per shingle
+MIN_BOILERPLATE_WORDS = 12  # Shorter paragraphs (skill bullets, headings) are never stripped
+MIN_COMPANY_POSTINGS = 3  # Shingle repeated in this many distinct roles of one company is boilerplate
+MIN_CORPUS_COMPANIES = 50  # Shingle shared by this many companies is boilerplate (EEO, benefits)
+BOILERPLATE_RATIO = 0.8  # Share of boilerplate shingles needed to drop a paragraph
+MOSTLY_STRIPPED_SHARE = 0.5  # Jobs above this share of stripped tokens are reported as mostly stripped
+MAX_STRIPPED_SHARE = 0.9  # Above this share of stripped tokens, fall back to the cleaned description
+PROMPT_TOKEN_BUDGET = 768  # Approximate tokens of description kept in the prompt
+
+TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+
+
+def clean_html(text):
+    """
+    Remove HTML tags and entities, keeping one paragraph per line.
+    """
+    if not text:
+        return ""
+    text = BeautifulSoup(text, "html.parser").get_text(separator="\n")
+    lines = [re.sub(r"\s+", " ", line).strip() for line in text.split("\n")]
+    return "\n".join(line for line in lines if line)
+
+
+def split_paragraphs(text):
+    """
+    Split cleaned text into non-empty paragraphs.
+    """
+    return [paragraph.strip() for paragraph in text.split("\n") if paragraph.strip()]
+
+
+def paragraph_words(paragraph):
+    """
+    Lowercase words of a paragraph, used for hashing.
+    """
+    return re.findall(r"\w+", paragraph.lower())
+
+
+def paragraph_shingles(paragraph):
+    """
+    Hash the word shingles of a paragraph.
+    Paragraphs shorter than a shingle have no shingles.
+    """
+    words = paragraph_words(paragraph)
+    return {
+        zlib.crc32(" ".join(words[i:i + SHINGLE_SIZE]).encode("utf-8"))
+        for i in range(len(words) - SHINGLE_SIZE + 1)
+    }
+
+
+def role_key(job, cleaned):
+    """
+    Identify the role of a posting so reposts are only counted once.
+    Uses the normalized title, or the cleaned description when there is no title.
+    """
+    title = " ".join(paragraph_words(job.get("title") or ""))
+    if title:
+        return job["company_id"], title
+    return job["company_id"], zlib.crc32(" ".join(paragraph_words(cleaned)).encode("utf-8"))
+
+
+def learn_boilerplate_shingles(jobs):
+    """
+    Learn shingles repeated across the corpus.
+    - Per company: shingles found in at least MIN_COMPANY_POSTINGS distinct roles
+    - Corpus-wide: shingles found in postings of at least MIN_CORPUS_COMPANIES companies
+    Only paragraphs long enough to be stripped contribute shingles.
+    Returns a (company_shingles, corpus_shingles) tuple.
+    """
+    company_counts = defaultdict(Counter)
+    shingle_companies = defaultdict(set)
+    seen_roles = set()
+
+    for job in jobs:
+        company_id = job["company_id"]
+        cleaned = clean_html(job["description"])
+        key = role_key(job, cleaned)
+        if key in seen_roles:
+            continue
+        seen_roles.add(key)
+
+        shingles = set()
+        for paragraph in split_paragraphs(cleaned):
+            if len(paragraph_words(paragraph)) >= MIN_BOILERPLATE_WORDS:
+                shingles |= paragraph_shingles(paragraph)
+        company_counts[company_id].update(shingles)
+        for shingle in shingles:
+            shingle_companies[shingle].add(company_id)
+
+    company_shingles = {
+        company_id: {shingle for shingle, count in counts.items() if count >= MIN_COMPANY_POSTINGS}
+        for company_id, counts in company_counts.items()
+    }
+    corpus_shingles = {
+        shingle for shingle, companies in shingle_companies.items()
+        if len(companies) >= MIN_CORPUS_COMPANIES
+    }
+    return company_shingles, corpus_shingles
+
+
+def count_tokens(text):
+    """
+    Approximate the number of LLM tokens in a text (words and punctuation).
+    """
+    return len(TOKEN_PATTERN.findall(text))
+
+
+def truncate_to_token_budget(text, budget=PROMPT_TOKEN_BUDGET):
+    """
+    Cut text after the given number of approximate tokens.
+    """
+    for index, match in enumerate(TOKEN_PATTERN.finditer(text)):
+        if index == budget:
+            return text[:match.start()].rstrip()
+    return text
+
+
+def is_boilerplate(paragraph, known_shingles, corpus_shingles):
+    """
+    Check whether a paragraph is mostly made of learned boilerplate shingles.
+    """
+    if len(paragraph_words(paragraph)) < MIN_BOILERPLATE_WORDS:
+        return False
+    shingles = paragraph_shingles(paragraph)
+    repeated = sum(1 for s in shingles if s in known_shingles or s in corpus_shingles)
+    return repeated / len(shingles) >= BOILERPLATE_RATIO
+
+
+def compact_description(text, company_id, boilerplate):
+    """
+    Strip HTML and learned boilerplate paragraphs, then truncate to the token budget.
+    When stripping would remove nearly everything, the boilerplate paragraphs are
+    kept after the remaining ones so truncation cuts them first.
+    Returns the prompt text and the share of cleaned tokens stripped as boilerplate.
+    """
+    company_shingles, corpus_shingles = boilerplate
+    known_shingles = company_shingles.get(company_id, set())
+
+    cleaned = clean_html(text)
+    kept, stripped = [], []
+    for paragraph in split_paragraphs(cleaned):
+        if is_boilerplate(paragraph, known_shingles, corpus_shingles):
+            stripped.append(paragraph)
+        else:
+            kept.append(paragraph)
+    compacted = "\n".join(kept)
+
+    cleaned_tokens = count_tokens(cleaned)
+    stripped_share = 1 - count_tokens(compacted) / cleaned_tokens if cleaned_tokens else 0.0
+    if stripped_share > MAX_STRIPPED_SHARE:
+        compacted = "\n".join(kept + stripped)
+    return truncate_to_token_budget(compacted), stripped_share
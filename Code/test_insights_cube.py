@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+
+from insights_cube import build_insights_cube, consolidate_skills, query_insights_cube
+
+
+def make_jobs(n=500, seed=0):
+    rng = np.random.default_rng(seed)
+    skills = ["Python", "python", "SQL", "Excel", "AWS", "Java"]
+    return pd.DataFrame(
+        {
+            "location": rng.choice(["New York", "San Francisco", None], n),
+            "formatted_experience_level": rng.choice(["Entry level", "Mid-Senior level"], n),
+            "work_type": rng.choice(["FULL_TIME", "CONTRACT", "PART_TIME"], n),
+            "remote_allowed": rng.choice([1.0, np.nan], n),
+            "med_salary": np.where(rng.random(n) < 0.5, np.nan, rng.uniform(1e4, 2e5, n)),
+            "extracted_skills": [list(set(rng.choice(skills, 3))) for _ in range(n)],
+        },
+        index=range(10, n + 10),
+    )
+
+
+def test_filtered_query_matches_refiltering():
+    jobs = make_jobs()
+    cube = build_insights_cube(jobs)
+    filters = {"location": ["New York"], "remote_allowed": ["Yes"], "work_type": ["FULL_TIME", "CONTRACT"]}
+    insights = query_insights_cube(cube, filters)
+
+    subset = jobs[
+        (jobs["location"] == "New York")
+        & (jobs["remote_allowed"] == 1)
+        & jobs["work_type"].isin(["FULL_TIME", "CONTRACT"])
+    ]
+    skill_counts = subset["extracted_skills"].explode().value_counts()
+    skill_counts = skill_counts.groupby(skill_counts.index.str.lower()).sum()
+    assert {skill.lower(): count for skill, count in insights["skills"].items()} == skill_counts.to_dict()
+
+    work_type_counts = {work_type: count for work_type, count in insights["work_type_counts"].items() if count}
+    assert work_type_counts == subset["work_type"].value_counts().to_dict()
+
+    expected_bins, _ = np.histogram(subset["med_salary"].dropna(), bins=cube["salary_edges"])
+    np.testing.assert_array_equal(insights["salary_counts"], expected_bins)
+
+
+def test_unfiltered_query_matches_consolidate_skills():
+    jobs = make_jobs()
+    cube = build_insights_cube(jobs)
+    insights = query_insights_cube(cube, {})
+
+    assert insights["skills"] == consolidate_skills(jobs["extracted_skills"].explode().dropna().tolist())
+    assert insights["salary_counts"].sum() == jobs["med_salary"].notna().sum()
+    assert sum(insights["work_type_counts"].values()) == len(jobs)
+
+
+def test_filter_with_no_matching_jobs_is_empty():
+    cube = build_insights_cube(make_jobs())
+    insights = query_insights_cube(cube, {"location": ["Nowhere"]})
+    assert insights["skills"] == {}
+    assert insights["salary_counts"].sum() == 0
+    assert sum(insights["work_type_counts"].values()) == 0
@@ -0,0 +1,111 @@
+from prompt_compaction import (
+    MAX_STRIPPED_SHARE,
+    MIN_CORPUS_COMPANIES,
+    clean_html,
+    compact_description,
+    learn_boilerplate_shingles,
+    truncate_to_token_budget,
+)
+
+EEO = (
+    "<p>We are an equal opportunity employer and all qualified applicants will receive "
+    "consideration for employment without regard to race, color, religion or sex.</p>"
+)
+SKILLS = "<ul><li>Python</li><li>SQL</li><li>AWS</li><li>Machine learning</li></ul>"
+
+
+def test_clean_html_keeps_paragraphs_and_drops_tags():
+    text = '<div\n class="intro">About &amp; us</div><ul><li>Python</li><li>SQL</li></ul>'
+    assert clean_html(text) == "About & us\nPython\nSQL"
+    assert clean_html(None) == ""
+
+
+def test_shared_skill_bullets_are_kept():
+    jobs = [
+        {"company_id": f"c{i}", "description": f"<p>Company {i} builds data products.</p>{SKILLS}"}
+        for i in range(MIN_CORPUS_COMPANIES)
+    ]
+    boilerplate = learn_boilerplate_shingles(jobs)
+    prompt_text, stripped_share = compact_description(jobs[0]["description"], "c0", boilerplate)
+    for skill in ["Python", "SQL", "AWS", "Machine learning"]:
+        assert skill in prompt_text
+    assert stripped_share == 0.0
+
+
+def test_corpus_boilerplate_paragraph_is_stripped():
+    jobs = [
+        {"company_id": f"c{i}", "description": f"<p>Company {i} needs a data engineer.</p>{SKILLS}{EEO}"}
+        for i in range(MIN_CORPUS_COMPANIES)
+    ]
+    boilerplate = learn_boilerplate_shingles(jobs)
+    prompt_text, stripped_share = compact_description(jobs[0]["description"], "c0", boilerplate)
+    assert "equal opportunity" not in prompt_text
+    assert "Python" in prompt_text
+    assert 0 < stripped_share < 1
+
+
+def test_reposted_job_is_not_stripped():
+    description = (
+        "<p>You will design and maintain batch and streaming pipelines in Python and Spark "
+        "for our analytics platform.</p>" + SKILLS
+    )
+    jobs = [{"company_id": "c0", "description": description} for _ in range(5)]
+    boilerplate = learn_boilerplate_shingles(jobs)
+    prompt_text, stripped_share = compact_description(description, "c0", boilerplate)
+    assert "streaming pipelines" in prompt_text
+    assert stripped_share == 0.0
+
+
+def test_templated_role_in_several_cities_is_not_stripped():
+    about = (
+        "<p>Acme is a leading provider of cloud analytics software trusted by thousands of "
+        "customers across the world since 1999.</p>"
+    )
+    duties = (
+        "<p>You will build and operate real-time data pipelines with Python, Kafka and Spark "
+        "for our analytics products.</p>"
+    )
+    jobs = [
+        {"company_id": "c0", "title": "Data Engineer", "description": f"<p>Join our {city} office.</p>{duties}{about}"}
+        for city in ["Austin", "Denver", "Boston"]
+    ]
+    boilerplate = learn_boilerplate_shingles(jobs)
+    prompt_text, _ = compact_description(jobs[0]["description"], "c0", boilerplate)
+    assert "Python, Kafka and Spark" in prompt_text
+
+
+def test_company_boilerplate_is_learned_across_roles():
+    about = (
+        "<p>Acme is a leading provider of cloud analytics software trusted by thousands of "
+        "customers across the world since 1999.</p>"
+    )
+    titles = ["Data Engineer", "Data Analyst", "Backend Developer"]
+    jobs = [
+        {"company_id": "c0", "title": title, "description": f"<p>We are hiring a {title}.</p>{SKILLS}{about}"}
+        for title in titles
+    ]
+    boilerplate = learn_boilerplate_shingles(jobs)
+    prompt_text, _ = compact_description(jobs[0]["description"], "c0", boilerplate)
+    assert "leading provider" not in prompt_text
+    assert "Python" in prompt_text
+
+
+def test_fallback_keeps_remaining_paragraphs_before_boilerplate():
+    jobs = [{"company_id": f"c{i}", "description": EEO} for i in range(MIN_CORPUS_COMPANIES)]
+    boilerplate = learn_boilerplate_shingles(jobs)
+    prompt_text, stripped_share = compact_description(EEO + "<p>Kubernetes</p>", "c0", boilerplate)
+    assert stripped_share > MAX_STRIPPED_SHARE
+    assert prompt_text.startswith("Kubernetes\nWe are")
+
+
+def test_fully_stripped_description_falls_back_to_cleaned_text():
+    jobs = [{"company_id": f"c{i}", "description": EEO} for i in range(MIN_CORPUS_COMPANIES)]
+    boilerplate = learn_boilerplate_shingles(jobs)
+    prompt_text, stripped_share = compact_description(EEO, "c0", boilerplate)
+    assert prompt_text == clean_html(EEO)
+    assert stripped_share == 1.0
+
+
+def test_truncate_to_token_budget():
+    assert truncate_to_token_budget("a b, c d", 3) == "a b,"
+    assert truncate_to_token_budget("a b", 3) == "a b"